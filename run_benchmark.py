@@ -29,7 +29,7 @@ except ImportError as e:
 
 try:
     import rapidfuzz
-    from rapidfuzz import process
+    from rapidfuzz import fuzz, process
     print(f"✓ RapidFuzz imported successfully (version {rapidfuzz.__version__})")
     RAPIDFUZZ_AVAILABLE = True
 except ImportError as e:
@@ -61,11 +61,9 @@ def generate_random_strings(n: int, length: int = 10, alphabet: str = None) -> l
     if alphabet is None:
         alphabet = 'abcdefghijklmnopqrstuvwxyz'
 
-    strings = []
-    for _ in range(n):
-        s = ''.join(random.choice(alphabet) for _ in range(length))
-        strings.append(s)
-    return strings
+    # Sample every character in one C-level call, then slice the result into strings
+    chars = ''.join(random.choices(alphabet, k=n * length))
+    return [chars[i:i + length] for i in range(0, n * length, length)] if length > 0 else [''] * n
 
 
 def generate_dna_sequences(n: int, length: int = 20) -> list[str]:
@@ -272,7 +270,8 @@ def benchmark_rapidfuzz(entries, queries, score_cutoff=80):
     start_search = time.perf_counter()
     results = []
     for query in queries:
-        match = process.extractOne(query, entries, score_cutoff=score_cutoff)
+        # Plain ratio with no preprocessing lets rapidfuzz stay in C and exit early below the cutoff
+        match = process.extractOne(query, entries, scorer=fuzz.ratio, score_cutoff=score_cutoff, processor=None)
         if match:
             results.append((match[0], match[1] == 100))  # exact if score is 100
         else:
@@ -53,11 +53,9 @@ def generate_random_strings(n: int, length: int = 10, alphabet: str = None) -> l
     if alphabet is None:
         alphabet = 'abcdefghijklmnopqrstuvwxyz'
 
-    strings = []
-    for _ in range(n):
-        s = ''.join(random.choice(alphabet) for _ in range(length))
-        strings.append(s)
-    return strings
+    # Sample every character in one C-level call, then slice the result into strings
+    chars = ''.join(random.choices(alphabet, k=n * length))
+    return [chars[i:i + length] for i in range(0, n * length, length)] if length > 0 else [''] * n
 
 
 def generate_dna_sequences(n: int, length: int = 20) -> list[str]:
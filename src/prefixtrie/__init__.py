@@ -30,9 +30,10 @@ class PrefixTrie:
     Thin wrapper around the cPrefixTrie class to provide a Python interface.
     """
 
-    __slots__ = ("_trie", "allow_indels", "immutable", "_entries", "_shared_memory", "_is_shared_owner", "_exact_set")
+    __slots__ = ("_trie", "allow_indels", "immutable", "_entries", "_shared_memory", "_is_shared_owner", "_exact_set", "use_bitparallel")
 
-    def __init__(self, entries: list[str], allow_indels: bool=False, immutable: bool=True, shared_memory_name: str=None):
+    def __init__(self, entries: list[str], allow_indels: bool=False, immutable: bool=True, shared_memory_name: str=None,
+                 use_bitparallel: bool=False):
         """
         Initialize the PrefixTrie with the given arguments.
 
@@ -40,6 +41,8 @@ class PrefixTrie:
         :param allow_indels: If True, allows insertions and deletions in the trie
         :param immutable: If True, the trie cannot be modified after creation
         :param shared_memory_name: If provided, load from existing shared memory block
+        :param use_bitparallel: If True, fuzzy searches with indels use Myers' bit-parallel edit distance
+                                for queries of up to 64 characters, which always returns a closest entry
         """
         global _cleanup_registered
 
@@ -50,10 +53,11 @@ class PrefixTrie:
             # Normal initialization
             self.allow_indels = allow_indels
             self.immutable = immutable
+            self.use_bitparallel = use_bitparallel
             if not isinstance(entries, list):
                 entries = list(entries)  # Ensure entries is a list
             self._entries = entries  # Store original entries for pickle support
-            self._trie = cPrefixTrie(entries, allow_indels, immutable)
+            self._trie = cPrefixTrie(entries, allow_indels, immutable, use_bitparallel)
             self._shared_memory = None
             self._is_shared_owner = False
             # Create Python set for ultra-fast exact matching
@@ -80,7 +84,8 @@ class PrefixTrie:
         data = {
             'entries': self._entries,
             'allow_indels': self.allow_indels,
-            'immutable': self.immutable
+            'immutable': self.immutable,
+            'use_bitparallel': self.use_bitparallel
         }
         serialized_data = pickle.dumps(data)
 
@@ -119,8 +124,9 @@ class PrefixTrie:
             # Initialize trie - shared memory tries are always immutable
             self.allow_indels = data['allow_indels']
             self.immutable = data.get('immutable', True)  # Default to immutable for backward compatibility
+            self.use_bitparallel = data.get('use_bitparallel', False)
             self._entries = data['entries']
-            self._trie = cPrefixTrie(self._entries, self.allow_indels, self.immutable)
+            self._trie = cPrefixTrie(self._entries, self.allow_indels, self.immutable, self.use_bitparallel)
             # Create Python set for ultra-fast exact matching
             self._exact_set = set(self._entries)
 
@@ -153,7 +159,8 @@ class PrefixTrie:
         return {
             'entries': self._entries,
             'allow_indels': self.allow_indels,
-            'immutable': self.immutable
+            'immutable': self.immutable,
+            'use_bitparallel': self.use_bitparallel
         }
 
     def __setstate__(self, state):
@@ -163,8 +170,9 @@ class PrefixTrie:
         """
         self.allow_indels = state['allow_indels']
         self.immutable = state.get('immutable', True)  # Default to immutable for backward compatibility
+        self.use_bitparallel = state.get('use_bitparallel', False)
         self._entries = state['entries']
-        self._trie = cPrefixTrie(self._entries, self.allow_indels, self.immutable)
+        self._trie = cPrefixTrie(self._entries, self.allow_indels, self.immutable, self.use_bitparallel)
         self._shared_memory = None
         self._is_shared_owner = False
         # Create Python set for ultra-fast exact matching
@@ -180,14 +188,19 @@ class PrefixTrie:
             # Object may not be fully initialized
             pass
 
-    def search(self, item: str, correction_budget: int=0) -> tuple[str | None, int]:
+    def search(self, item: str | bytes, correction_budget: int=0) -> tuple[str | None, int]:
         """
         Search for an item in the trie with optional corrections.
 
-        :param item: The string to search for in the trie.
+        :param item: The string to search for in the trie. UTF-8 encoded bytes are also accepted, which lets
+                     callers encode their queries once up front.
         :param correction_budget: Maximum number of corrections allowed (default is 0).
         :return: A tuple containing the found item and the number of corrections, or (None, -1) if not found.
         """
+        if type(item) is bytes:
+            # The exact-match set holds str, so encoded queries go straight to the trie
+            return self._trie.search(item, correction_budget)
+
         # Ultra-fast exact matching using Python set (bypasses all Cython overhead)
         if correction_budget == 0:
             # For exact matching, use pure Python set lookup - fastest possible
@@ -201,6 +214,53 @@ class PrefixTrie:
         found, corrections = self._trie.search(item, correction_budget)
         return found, corrections
 
+    def search_many(self, items: list[str | bytes], correction_budget: int=0) -> tuple[list[str | None], list[int]]:
+        """
+        Search for a batch of items in the trie with optional corrections.
+
+        This is equivalent to calling search() on each item, but avoids the per-call overhead. With a
+        correction budget above 0, the whole batch runs inside the Cython layer without holding the GIL;
+        at budget 0, str items are looked up in the exact-match set instead.
+
+        :param items: List of strings to search for in the trie, or of UTF-8 encoded bytes.
+        :param correction_budget: Maximum number of corrections allowed per item (default is 0).
+        :return: A tuple of two parallel lists: the found items (or None) and the number of corrections (or -1).
+        """
+        if not isinstance(items, list):
+            items = list(items)
+
+        if correction_budget == 0:
+            # For exact matching, use pure Python set lookup - fastest possible
+            exact_set = self._exact_set
+            found = [item if item in exact_set else None for item in items]
+            if None in found:
+                # The set holds str, so encoded queries (which always miss it) go to the trie in one batch
+                bytes_indices = [i for i, f in enumerate(found) if f is None and type(items[i]) is bytes]
+                if bytes_indices:
+                    bytes_found, _ = self._trie.search_many([items[i] for i in bytes_indices], 0)
+                    for i, f in zip(bytes_indices, bytes_found):
+                        found[i] = f
+            return found, [-1 if f is None else 0 for f in found]
+
+        return self._trie.search_many(items, correction_budget)
+
+    def search_packed(self, packed, lengths) -> list[str | None]:
+        """
+        Exact search for a batch of DNA queries stored 2 bits per base.
+
+        Bases are coded A=0, C=1, G=2, T=3 and packed four per byte, with the first base in the
+        two high bits. Each row is looked up by its packed bytes in a hash index of every entry made
+        up only of A, C, G and T, so no Python string is created per query. The index is built on
+        the first call (and again after add() or remove()) and is kept alongside the trie: it holds
+        a packed copy of each such entry, about a quarter of its length plus a few dozen bytes of
+        hash table overhead per entry.
+
+        :param packed: A C-contiguous uint8 buffer of shape (n_queries, row_bytes), one packed query per row.
+        :param lengths: A C-contiguous buffer of Py_ssize_t (e.g. numpy intp) holding the number of bases per query.
+        :return: A list with the found item (or None) for each query.
+        """
+        return self._trie.search_packed(packed, lengths)
+
     def search_substring(self, target_string: str, correction_budget: int=0) -> tuple[str | None, int, int, int]:
         """
         Search for fuzzy substring matches of trie entries within a target string.
@@ -4,11 +4,13 @@
 from libc.stdlib cimport malloc, free
 # from libc.stddef cimport size_t
 from libc.string cimport strcpy, strlen, memcpy, memset
+from libcpp.string cimport string
 from libcpp.unordered_map cimport unordered_map
 from libcpp.unordered_set cimport unordered_set
 from libcpp.utility cimport pair
 from libcpp.vector cimport vector
 from cython.operator cimport dereference as deref, preincrement as preinc
+from cpython.bytes cimport PyBytes_AS_STRING
 from cpython.unicode cimport PyUnicode_AsUTF8AndSize, PyUnicode_FromString
 import cython
 
@@ -32,6 +34,14 @@ cdef Str py_str_to_c_str(str py_str):
     c_str[n_bytes] = '\0'
     return c_str
 
+cdef inline Str borrow_query_chars(object query) except NULL:
+    # Borrow the query's own NUL-terminated buffer: the cached UTF-8 form of a str, or the raw data of
+    # a bytes object (e.g. queries encoded once up front). The caller must keep the query alive.
+    cdef Py_ssize_t n_bytes
+    if type(query) is bytes:
+        return PyBytes_AS_STRING(query)
+    return <Str> PyUnicode_AsUTF8AndSize(query, &n_bytes)
+
 cdef str c_str_to_py_str(const Str c_str):
     if c_str == NULL:
         return None
@@ -61,6 +71,7 @@ cdef struct TrieNode:
 
     # Cold data
     char value
+    bint owns_collapsed  # False when collapsed points into the buffer of an ancestor on the same chain
     TrieNode* parent
 # -----------------------------
 # TrieNode Memory Pool
@@ -120,6 +131,12 @@ cdef inline void append_child_at_index(TrieNode* p, TrieNode* c, int idx) noexce
     c.parent = p
     deref(p.children_idx).push_back(idx)
 
+cdef inline void release_collapsed(TrieNode* node) noexcept nogil:
+    if node.owns_collapsed:
+        free(node.collapsed)
+    node.collapsed = NULL
+    node.owns_collapsed = False
+
 cdef inline bint is_leaf(const TrieNode* node) noexcept nogil:
     return n_children(node) == 0
 
@@ -204,6 +221,10 @@ cdef inline void cache_free(CacheState * st) noexcept nogil:
             del st.data  # delete C++ unordered_map
         free(st)
 
+cdef inline void cache_clear(CacheState * st) noexcept nogil:
+    # Drop all entries but keep the allocated buckets around for the next query
+    deref(st.data).clear()
+
 cdef inline bint cache_contains(const CacheState * st, const Key key) noexcept nogil:
     return deref(st.data).find(key) != deref(st.data).end()
 
@@ -275,6 +296,86 @@ cdef inline void count_cache_mark_visited(CountCacheState* st, Key key) noexcept
     deref(st.data)[key] = True
 
 
+# -----------------------------
+# 2-bit packed DNA keys
+# -----------------------------
+cdef inline int dna_code(const char c) noexcept nogil:
+    if c == b'A':
+        return 0
+    if c == b'C':
+        return 1
+    if c == b'G':
+        return 2
+    if c == b'T':
+        return 3
+    return -1
+
+cdef inline void make_packed_key(string* key, const unsigned char* packed, const size_t n_bases) noexcept nogil:
+    # Packed bytes (four bases per byte, first base in the high bits) followed by n_bases % 4,
+    # which tells apart sequences that only differ by trailing padding, e.g. "A" and "AA"
+    cdef size_t n_bytes = (n_bases + 3) >> 2
+    cdef size_t tail = n_bases & 3
+    key.assign(<const char*> packed, n_bytes)
+    if tail:
+        # Ignore whatever is stored in the unused low bits of the last byte
+        key[0][n_bytes - 1] = <char> (<unsigned char> key[0][n_bytes - 1] & <unsigned char> (0xFF << (8 - 2 * tail)))
+    key.push_back(<char> tail)
+
+# -----------------------------
+# Bit-parallel edit distance (Myers/Hyyro)
+# -----------------------------
+ctypedef unsigned long long Bits  # One bit per query character, so queries of up to 64 characters
+
+cdef size_t BITPARALLEL_MAX_QUERY_LEN = 64
+
+cdef inline void myers_step(const Bits eq, Bits* vp, Bits* vn, int* score, const Bits high) noexcept nogil:
+    # Advance the edit distance column of the query by one trie character.
+    # vp/vn hold the vertical +1/-1 deltas, score the distance of the whole query (the last row).
+    cdef Bits d0 = (((eq & vp[0]) + vp[0]) ^ vp[0]) | eq | vn[0]
+    cdef Bits hp = vn[0] | ~(d0 | vp[0])
+    cdef Bits hn = vp[0] & d0
+    if hp & high:
+        score[0] += 1
+    elif hn & high:
+        score[0] -= 1
+    # The top row is the number of trie characters consumed, so it always grows by one
+    hp = (hp << 1) | 1
+    hn = hn << 1
+    vp[0] = hn | ~(d0 | hp)
+    vn[0] = hp & d0
+
+cdef inline int popcount64(Bits x) noexcept nogil:
+    x = x - ((x >> 1) & 0x5555555555555555ULL)
+    x = (x & 0x3333333333333333ULL) + ((x >> 2) & 0x3333333333333333ULL)
+    x = (x + (x >> 4)) & 0x0F0F0F0F0F0F0F0FULL
+    return <int> ((x * 0x0101010101010101ULL) >> 56)
+
+cdef inline int myers_column_min(const Bits vp, const Bits vn, const size_t query_len, const size_t depth,
+                                 const int limit) noexcept nogil:
+    # Smallest distance in the column, a lower bound for every extension of the current trie path.
+    # Rows further than limit from the diagonal are at least that far off anyway, so only the band is scanned.
+    cdef size_t lo = depth - <size_t> limit if depth > <size_t> limit else 0
+    cdef size_t hi = depth + <size_t> limit
+    cdef Bits below
+    cdef int val, col_min
+    if hi > query_len:
+        hi = query_len
+    if lo > hi:
+        return limit + 1
+    # Row lo is the top row plus the vertical deltas of the rows above it
+    below = ((<Bits> 1) << lo) - 1 if lo < BITPARALLEL_MAX_QUERY_LEN else <Bits> -1
+    val = <int> depth + popcount64(vp & below) - popcount64(vn & below)
+    col_min = val
+    while lo < hi:
+        if vp & ((<Bits> 1) << lo):
+            val += 1
+        elif vn & ((<Bits> 1) << lo):
+            val -= 1
+            if val < col_min:
+                col_min = val
+        lo += 1
+    return col_min
+
 cdef void _traverse(TrieNode* n, list entries):
     if n is NULL:
         return
@@ -333,11 +434,15 @@ cdef class cPrefixTrie:
     cdef size_t max_length
     cdef size_t min_length
     cdef int last_node_id
+    cdef unordered_map[string, TrieNode*] packed_index  # Built lazily by search_packed()
+    cdef bint packed_index_ready
+    cdef bint use_bitparallel
 
     def __cinit__(self, *args, **kwargs):
         self.node_pool = TrieNodePool()
 
-    def __init__(self, entries: list[str], allow_indels: bool = False, immutable: bool = True):
+    def __init__(self, entries: list[str], allow_indels: bool = False, immutable: bool = True,
+                 use_bitparallel: bool = False):
         # Initialize alphabet with full 256-character support for mutable tries
         # For immutable tries, we can still optimize by scanning only the entries
         cdef bint[256] seen
@@ -371,13 +476,30 @@ cdef class cPrefixTrie:
         self.n_entries = 0
         self.allow_indels = allow_indels
         self.immutable = immutable
+        self.use_bitparallel = use_bitparallel
         self.max_length = 0
         self.min_length = <size_t> -1  # Maximum possible size_t value
         self.last_node_id = 1
         cdef int last_id = 1
-        for entry in entries:
-            last_id = self._insert(entry, last_id)
-            self.n_entries += 1
+        # Front coding: each entry starts from the node where it leaves the previous entry's path,
+        # so shared prefixes (the whole point of sorted input) are never walked again
+        cdef vector[TrieNode*] path
+        cdef Str prev_entry = NULL
+        cdef size_t lcp
+        path.push_back(self.root)
+        try:
+            for entry in entries:
+                c_entry = py_str_to_c_str(entry)
+                lcp = 0
+                if prev_entry != NULL:
+                    while prev_entry[lcp] != '\0' and prev_entry[lcp] == c_entry[lcp]:
+                        lcp += 1
+                    free(prev_entry)
+                prev_entry = c_entry
+                last_id = self._insert_frontcoded(&path, c_entry, lcp, last_id)
+                self.n_entries += 1
+        finally:
+            free(prev_entry)
         self.last_node_id = last_id  # Store the last used ID
         self._compile(self.root)  # Compile the Trie
         self._compute_length_bounds(self.root)  # Compute min/max remaining lengths
@@ -420,6 +542,7 @@ cdef class cPrefixTrie:
         # Add the entry
         self.last_node_id = self._insert(entry, self.last_node_id)
         self.n_entries += 1
+        self._invalidate_packed_index()
 
         # Recompile the trie to update collapsed paths and bounds
         self._compile(self.root)
@@ -442,6 +565,7 @@ cdef class cPrefixTrie:
         cdef bint removed = self._remove_entry(entry)
         if removed:
             self.n_entries -= 1
+            self._invalidate_packed_index()
             # Recompile the trie to update collapsed paths and bounds
             self._compile(self.root)
             self._compute_length_bounds(self.root)
@@ -481,6 +605,43 @@ cdef class cPrefixTrie:
         finally:
             free(c_entry)
 
+    cdef void _invalidate_packed_index(self):
+        self.packed_index.clear()
+        self.packed_index_ready = False
+
+    cdef void _build_packed_index(self):
+        """
+        Index every entry made up only of A, C, G and T by its 2-bit packed form.
+        """
+        cdef vector[unsigned char] packed
+        cdef string key
+        cdef Str c_entry
+        cdef size_t i, n
+        cdef int code
+        cdef bint is_dna
+        cdef TrieNode* node
+        cdef str entry
+
+        self.packed_index.clear()
+        for entry in self:
+            c_entry = py_str_to_c_str(entry)
+            n = simd_strlen(c_entry)
+            packed.assign(((n + 3) >> 2) + 1, 0)
+            is_dna = True
+            for i in range(n):
+                code = dna_code(c_entry[i])
+                if code < 0:
+                    is_dna = False
+                    break
+                packed[i >> 2] |= <unsigned char> (code << (6 - 2 * (i & 3)))
+            if is_dna:
+                node = self._find_exact(c_entry, n)
+                if node != NULL:
+                    make_packed_key(&key, packed.data(), n)
+                    self.packed_index[key] = node
+            free(c_entry)
+        self.packed_index_ready = True
+
     cpdef bint is_immutable(self):
         """
         Check if the trie is immutable.
@@ -495,6 +656,7 @@ cdef class cPrefixTrie:
         node.node_id = node_id
         node.value = value
         node.collapsed = NULL
+        node.owns_collapsed = False
         node.skip_to = NULL
         node.children = <TrieNode**> malloc(alphabet_size * sizeof(TrieNode*))
         if not node.children:
@@ -556,58 +718,104 @@ cdef class cPrefixTrie:
         free(c_entry)
         return last_id
 
+    cdef int _insert_frontcoded(self, vector[TrieNode*]* path, Str c_entry, size_t lcp, int last_id) except -1:
+        """
+        Insert an entry that shares its first lcp characters with the previously inserted one.
+        :param path: The nodes along the previously inserted entry (path[d] is reached after d characters),
+                     updated in place to the nodes along this entry.
+        :return: The next unused node ID.
+        """
+        cdef TrieNode* node = deref(path)[lcp]
+        cdef size_t i, n = simd_strlen(c_entry)
+        cdef int idx
+
+        if n > self.max_length:
+            self.max_length = n
+        if n < self.min_length:
+            self.min_length = n
+
+        path.resize(lcp + 1)
+        for i in range(lcp, n):
+            idx = self.alphabet.map[<unsigned char> c_entry[i]]
+            if idx < 0:
+                raise ValueError("Character not in alphabet")
+            if node.children[idx] == NULL:
+                append_child_at_index(node, self._create_node(last_id, c_entry[i], node,
+                                                              <size_t> self.alphabet.size), idx)
+                last_id += 1
+            node = node.children[idx]
+            path.push_back(node)
+
+        if node.leaf_value == NULL:
+            node.leaf_value = <Str> malloc(n + 1)
+            if not node.leaf_value:
+                raise MemoryError("Failed to allocate memory for leaf value")
+            strcpy(node.leaf_value, c_entry)
+        return last_id
+
     cdef void _compile(self, TrieNode* node):
-        cdef size_t i
-        cdef TrieNode* child
-        cdef size_t clen
+        """
+        Compute the collapsed path and skip target of every node from node down.
+        The nodes of a single-child chain all share one buffer, owned by the first node of the chain,
+        since each one's collapsed path is the next one's with its own character in front.
+        """
+        cdef size_t i, chain_len, offset
+        cdef TrieNode* end
+        cdef TrieNode* curr
+        cdef Str buf
         if not node:
             return
 
-        # Prevent memory leak by freeing existing collapsed value before re-assigning
-        if node.collapsed:
-            free(node.collapsed)
-            node.collapsed = NULL
-
-        if has_complete(node):
+        if n_children(node) != 1:
+            release_collapsed(node)
             node.collapsed = <Str> malloc(2)
             if not node.collapsed:
                 raise MemoryError("Failed to allocate memory for collapsed value")
+            node.owns_collapsed = True
             node.collapsed[0] = node.value
             node.collapsed[1] = '\0'
             node.collapsed_len = 1
             node.skip_to = node
-            if is_leaf(node):  # It is a leaf, so we are done
-                return
-
-        if n_children(node) == 1:
-            self._compile(child_at(node, 0))
-            # Root (value == '\0') should not prefix its value
-            if node.value == '\0':
-                node.collapsed = <Str> malloc(simd_strlen(child_at(node, 0).collapsed) + 1)
-                if not node.collapsed:
-                    raise MemoryError("Failed to allocate memory for collapsed value")
-                strcpy(node.collapsed, child_at(node, 0).collapsed)
-                node.collapsed_len = child_at(node, 0).collapsed_len
-            else:
-                clen = child_at(node, 0).collapsed_len
-                node.collapsed = <Str> malloc(clen + 2)  # +1 for node.value, +1 for '\0'
-                if not node.collapsed:
-                    raise MemoryError("Failed to allocate memory for collapsed value")
-                node.collapsed[0] = node.value
-                strcpy(node.collapsed + 1, child_at(node, 0).collapsed)
-                node.collapsed_len = clen + (1 if node.value != '\0' else 0)
-            node.skip_to = child_at(node, 0).skip_to
-        else:
             for i in range(n_children(node)):
-                child = child_at(node, i)
-                self._compile(child)
-            node.collapsed = <Str> malloc(2)
-            if not node.collapsed:
-                raise MemoryError("Failed to allocate memory for collapsed value")
-            node.collapsed[0] = node.value
-            node.collapsed[1] = '\0'
-            node.collapsed_len = 1
-            node.skip_to = node
+                self._compile(child_at(node, i))
+            return
+
+        # Walk to the end of the chain: the first node with zero or several children
+        # Root (value == '\0') should not prefix its value
+        chain_len = 0 if node.value == '\0' else 1
+        end = child_at(node, 0)
+        chain_len += 1
+        while n_children(end) == 1:
+            end = child_at(end, 0)
+            chain_len += 1
+
+        buf = <Str> malloc(chain_len + 1)
+        if not buf:
+            raise MemoryError("Failed to allocate memory for collapsed value")
+        i = 0
+        if node.value != '\0':
+            buf[i] = node.value
+            i += 1
+        curr = node
+        while curr != end:
+            curr = child_at(curr, 0)
+            buf[i] = curr.value
+            i += 1
+        buf[i] = '\0'
+
+        # Every node on the chain points at its own suffix of the buffer
+        offset = 0
+        curr = node
+        while curr != end:
+            release_collapsed(curr)
+            curr.collapsed = buf + offset
+            curr.collapsed_len = chain_len - offset
+            curr.owns_collapsed = curr == node
+            curr.skip_to = end
+            if curr.value != '\0':
+                offset += 1
+            curr = child_at(curr, 0)
+        self._compile(end)
 
     cdef pair[size_t, size_t] _compute_length_bounds(self, TrieNode* node) noexcept nogil:
         cdef size_t m = n_children(node)
@@ -637,32 +845,176 @@ cdef class cPrefixTrie:
         child_bounds.second = node.max_remaining
         return child_bounds
 
-    cpdef tuple[str, int] search(self, str query, int correction_budget=0):
+    cdef TrieNode* _find_exact(self, const char* query, size_t query_len) noexcept nogil:
+        """
+        Walk straight down the trie along the query.
+        :return: The node holding the query as a complete entry, or NULL if it is not in the trie.
+        """
+        cdef TrieNode* node = self.root
+        cdef size_t i = 0
+        cdef size_t skip_len
+        cdef Str skip_str
+        cdef int ai
+        while i < query_len:
+            # Collapsed single-child chain: compare the whole edge at once instead of a node per character
+            if node.collapsed is not NULL and node.skip_to is not NULL and node.skip_to != node:
+                skip_len = node.collapsed_len
+                skip_str = node.collapsed
+                if node.value != '\0':  # Root node should not count its value
+                    skip_len -= 1
+                    skip_str = node.collapsed + 1
+                if skip_len > 0 and i + skip_len <= query_len:
+                    if simd_strncmp(skip_str, query + i, skip_len) != 0:
+                        return NULL  # The chain is the only way down
+                    node = node.skip_to
+                    i += skip_len
+                    continue
+            ai = self.alphabet.map[<unsigned char> query[i]]
+            if ai < 0 or node.children[ai] == NULL:
+                return NULL
+            node = node.children[ai]
+            i += 1
+        if has_complete(node):
+            return node
+        return NULL
+
+    cpdef tuple[str, int] search(self, object query, int correction_budget=0):
         """
         Search for a query in the trie, allowing for a specified number of corrections.
-        :param query: The query string to search for.
+        :param query: The query string (str, or UTF-8 encoded bytes) to search for.
         :param correction_budget: The maximum number of corrections allowed.
         :return: A tuple containing the found string and the number of corrections,
                  or (None, -1) if no match is found.
         """
-        cdef Str c_query = py_str_to_c_str(query)
+        cdef Str c_query = borrow_query_chars(query)
         cdef str found_str_py = None
         cdef size_t query_len = simd_strlen(c_query)
-        cdef CacheState * st = cache_new()
-        cache_reserve(st, query_len)  # Pre-allocate some space
+
+        # Fast path for exact hits (d=0): no cache or correction machinery needed
+        cdef TrieNode* exact_node = self._find_exact(c_query, query_len)
+        if exact_node != NULL:
+            return c_str_to_py_str(exact_node.leaf_value), 0
+        if correction_budget <= 0:
+            return None, -1
+
+        cdef CacheState * st = NULL
         cdef SearchResult res
-        with nogil:
-            res = self._search(
-                st, self.root, c_query, query_len,
-                0, 0, correction_budget, self.allow_indels, False
-            )
-        cache_free(st)
-        free(c_query)
+        if self._can_search_bitparallel(query_len):
+            with nogil:
+                res = self._search_bitparallel(c_query, query_len, correction_budget)
+        else:
+            st = cache_new()
+            cache_reserve(st, query_len)  # Pre-allocate some space
+            with nogil:
+                res = self._search(
+                    st, self.root, c_query, query_len,
+                    0, 0, correction_budget, self.allow_indels, False
+                )
+            cache_free(st)
         if res.found:
             found_str_py = c_str_to_py_str(res.found_str)
             return found_str_py, res.corrections
         return None, -1
 
+    cpdef tuple search_many(self, list queries, int correction_budget=0):
+        """
+        Search for a batch of queries in the trie, allowing for a specified number of corrections.
+        All queries are converted up front and searched in a single GIL-free loop.
+        :param queries: The list of query strings (str, or UTF-8 encoded bytes) to search for.
+        :param correction_budget: The maximum number of corrections allowed per query.
+        :return: A tuple of two parallel lists: the found strings (or None) and the number of
+                 corrections (or -1) for each query.
+        """
+        # Holds a reference to every query while the loop borrows their buffers
+        cdef tuple items = tuple(queries)
+        cdef Py_ssize_t n = len(items)
+        cdef Py_ssize_t i
+        cdef vector[Str] c_queries
+        cdef vector[size_t] query_lens
+        cdef vector[SearchResult] c_results
+        cdef TrieNode* exact_node
+        cdef CacheState * st = NULL
+        cdef list found = [None] * n
+        cdef list corrections = [-1] * n
+
+        c_queries.reserve(n)
+        query_lens.reserve(n)
+        try:
+            for i in range(n):
+                c_queries.push_back(borrow_query_chars(items[i]))
+                query_lens.push_back(simd_strlen(c_queries.back()))
+            c_results.resize(n)
+            st = cache_new()
+            with nogil:
+                for i in range(n):
+                    # Fast path for exact hits (d=0): no cache or correction machinery needed
+                    exact_node = self._find_exact(c_queries[i], query_lens[i])
+                    if exact_node != NULL:
+                        c_results[i].found = True
+                        c_results[i].found_str = exact_node.leaf_value
+                        c_results[i].corrections = 0
+                        continue
+                    if correction_budget <= 0:
+                        c_results[i].found = False
+                        continue
+                    if self._can_search_bitparallel(query_lens[i]):
+                        c_results[i] = self._search_bitparallel(c_queries[i], query_lens[i], correction_budget)
+                        continue
+                    cache_clear(st)
+                    cache_reserve(st, query_lens[i])
+                    c_results[i] = self._search(
+                        st, self.root, c_queries[i], query_lens[i],
+                        0, 0, correction_budget, self.allow_indels, False
+                    )
+        finally:
+            cache_free(st)
+
+        for i in range(n):
+            if c_results[i].found:
+                found[i] = c_str_to_py_str(c_results[i].found_str)
+                corrections[i] = c_results[i].corrections
+        return found, corrections
+
+    cpdef list search_packed(self, const unsigned char[:, ::1] packed, const Py_ssize_t[::1] lengths):
+        """
+        Exact search for a batch of 2-bit packed DNA queries.
+        Bases are coded A=0, C=1, G=2, T=3 and packed four per byte, the first base in the two high bits.
+        Rows are looked up in packed_index, a hash map from packed entry to node built on first use.
+        :param packed: A (n_queries, row_bytes) C-contiguous uint8 buffer, one packed query per row.
+        :param lengths: The number of bases in each query.
+        :return: A list with the found string (or None) for each query.
+        """
+        cdef Py_ssize_t n = packed.shape[0]
+        cdef Py_ssize_t row_bytes = packed.shape[1]
+        cdef Py_ssize_t i
+        cdef string key
+        cdef unordered_map[string, TrieNode*].iterator it
+        cdef vector[TrieNode*] nodes
+        cdef list found = [None] * n
+
+        if lengths.shape[0] != n:
+            raise ValueError("packed and lengths must describe the same number of queries")
+        for i in range(n):
+            if lengths[i] < 0 or lengths[i] > 4 * row_bytes:
+                raise ValueError(f"Query length {lengths[i]} does not fit in {row_bytes} packed bytes")
+        if n == 0:
+            return found
+
+        if not self.packed_index_ready:
+            self._build_packed_index()
+        nodes.resize(n)
+        with nogil:
+            for i in range(n):
+                # Hash lookup on the packed bytes instead of a per-base trie walk
+                make_packed_key(&key, &packed[i, 0], lengths[i])
+                it = self.packed_index.find(key)
+                nodes[i] = deref(it).second if it != self.packed_index.end() else NULL
+
+        for i in range(n):
+            if nodes[i] != NULL:
+                found[i] = c_str_to_py_str(nodes[i].leaf_value)
+        return found
+
     cpdef tuple[str, int, int, int] search_substring(self, str target_string, int correction_budget=0):
         """
         Search for fuzzy substring matches of trie entries within a target string.
@@ -760,6 +1112,94 @@ cdef class cPrefixTrie:
         free(c_query)
         return found_entries.size()
 
+    cdef inline bint _can_search_bitparallel(self, size_t query_len) noexcept nogil:
+        # Myers' algorithm computes edit distance, so it only replaces the search when indels are allowed
+        return self.use_bitparallel and self.allow_indels and 0 < query_len <= BITPARALLEL_MAX_QUERY_LEN
+
+    cdef SearchResult _search_bitparallel(self, Str query, size_t query_len, int max_corrections) noexcept nogil:
+        """
+        Search for the entry with the smallest edit distance to the query, tracking the distances of the
+        whole query as bit vectors while walking the trie (Myers' bit-parallel algorithm).
+        Requires 0 < query_len <= 64, and that the query itself is not an entry (callers check that first).
+        """
+        cdef Bits[256] peq  # Bit i is set for the alphabet index of query[i]
+        cdef size_t i
+        cdef int ai
+        cdef SearchResult best
+        cdef Bits all_rows = (<Bits> -1) >> (BITPARALLEL_MAX_QUERY_LEN - query_len)
+
+        memset(peq, 0, sizeof(peq))
+        for i in range(query_len):
+            ai = self.alphabet.map[<unsigned char> query[i]]
+            if ai >= 0:
+                peq[ai] |= (<Bits> 1) << i
+
+        best.found = False
+        best.found_str = NULL
+        best.corrections = max_corrections + 1  # Only strictly better results are kept
+        # Without an exact hit, any entry one correction away is already a closest one
+        cdef int floor = 1
+        # Before any trie character, row i of the column is i: every vertical delta is +1
+        self._bitparallel_dfs(self.root, query, query_len, peq, all_rows, 0, <int> query_len, 0, floor, &best)
+        if not best.found:
+            best.corrections = -1
+        return best
+
+    cdef void _bitparallel_dfs(self, TrieNode* node, Str query, size_t query_len, const Bits* peq,
+                               Bits vp, Bits vn, int score, size_t depth, const int floor,
+                               SearchResult* best) noexcept nogil:
+        cdef int limit = best.corrections - 1
+        cdef size_t min_len, max_len, len_diff, m, i
+        cdef int want = -1
+        cdef int idx_child
+        cdef Bits child_vp, child_vn
+        cdef int child_score
+
+        if has_complete(node) and score <= limit:
+            best.found = True
+            best.found_str = node.leaf_value
+            best.corrections = score
+            limit = score - 1
+        if limit < floor or is_leaf(node):
+            return
+
+        # Prune if the length difference alone exceeds the remaining budget
+        min_len = depth + node.min_remaining
+        max_len = depth + node.max_remaining
+        if query_len < min_len:
+            len_diff = min_len - query_len
+        elif query_len > max_len:
+            len_diff = query_len - max_len
+        else:
+            len_diff = 0
+        if <int> len_diff > limit:
+            return
+        if myers_column_min(vp, vn, query_len, depth, limit) > limit:
+            return
+
+        # Follow the child matching the query first, so good results tighten the limit early
+        if depth < query_len:
+            want = self.alphabet.map[<unsigned char> query[depth]]
+            if want >= 0 and node.children[want] != NULL:
+                child_vp, child_vn, child_score = vp, vn, score
+                myers_step(peq[want], &child_vp, &child_vn, &child_score, (<Bits> 1) << (query_len - 1))
+                self._bitparallel_dfs(node.children[want], query, query_len, peq,
+                                      child_vp, child_vn, child_score, depth + 1, floor, best)
+            else:
+                want = -1
+
+        m = n_children(node)
+        for i in range(m):
+            idx_child = <int> deref(node.children_idx)[i]
+            if idx_child == want:
+                continue
+            if best.corrections <= floor:
+                return
+            child_vp, child_vn, child_score = vp, vn, score
+            myers_step(peq[idx_child], &child_vp, &child_vn, &child_score, (<Bits> 1) << (query_len - 1))
+            self._bitparallel_dfs(node.children[idx_child], query, query_len, peq,
+                                  child_vp, child_vn, child_score, depth + 1, floor, best)
+
     cdef SearchResult _search(self,
                               CacheState * st,
                               TrieNode* node,
@@ -1402,8 +1842,7 @@ cdef class cPrefixTrie:
             del node.children_idx  # delete C++ vector
         if node.children != NULL:
             free(node.children)  # free C array of children pointers
-        if node.collapsed:
-            free(node.collapsed)
+        release_collapsed(node)
         if node.leaf_value:
             free(node.leaf_value)
         # The TrieNode struct itself is not freed, as its memory is managed by the TrieNodePool.
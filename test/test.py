@@ -2235,3 +2235,239 @@ class TestPrefixTrieSearchCount:
         assert trie.search_count("test", correction_budget=1) == 2  # test, tests
         assert trie.search_count("test", correction_budget=2) == 4  # test, tests, tester, toast
 
+
+
+class TestPrefixTrieSearchMany:
+    """Test the batched search_many method"""
+
+    def test_search_many_exact(self):
+        """Test search_many with exact matches"""
+        trie = PrefixTrie(["hello", "world", "test"])
+        found, corrections = trie.search_many(["hello", "nope", "test"])
+        assert found == ["hello", None, "test"]
+        assert corrections == [0, -1, 0]
+
+    def test_search_many_fuzzy(self):
+        """Test search_many with fuzzy matches"""
+        trie = PrefixTrie(["hello", "world", "test"], allow_indels=True)
+        found, corrections = trie.search_many(["hallo", "wrld", "test", "xyz"], correction_budget=1)
+        assert found == ["hello", "world", "test", None]
+        assert corrections == [1, 1, 0, -1]
+
+    def test_search_many_empty(self):
+        """Test search_many with no queries"""
+        trie = PrefixTrie(["hello"])
+        assert trie.search_many([]) == ([], [])
+        assert trie.search_many([], correction_budget=2) == ([], [])
+
+    def test_search_many_matches_search(self):
+        """Test that search_many agrees with search for every query"""
+        entries = ["ACGT", "ACGTA", "TTGCA", "GGGCCC", "ACG", "CATCAT"]
+        queries = ["ACGT", "ACGA", "ACG", "TTGC", "GGGCC", "CATGAT", "AAAA", "", "ACGTAA"]
+        for allow_indels in (False, True):
+            trie = PrefixTrie(entries, allow_indels=allow_indels)
+            for budget in (0, 1, 2):
+                found, corrections = trie.search_many(queries, correction_budget=budget)
+                assert list(zip(found, corrections)) == [trie.search(q, correction_budget=budget) for q in queries]
+
+    def test_search_many_accepts_iterables(self):
+        """Test search_many with non-list inputs"""
+        trie = PrefixTrie(["apple", "banana"], allow_indels=True)
+        found, corrections = trie.search_many(("apple", "banan"), correction_budget=1)
+        assert found == ["apple", "banana"]
+        assert corrections == [0, 1]
+
+    def test_search_many_exact_hits_with_budget(self):
+        """Test that exact hits report zero corrections even when a budget is given"""
+        entries = ["", "abc", "abd", "abcd"]
+        trie = PrefixTrie(entries, allow_indels=True)
+        found, corrections = trie._trie.search_many(entries, 2)
+        assert found == entries
+        assert corrections == [0, 0, 0, 0]
+        for entry in entries:
+            assert trie._trie.search(entry, 2) == (entry, 0)
+
+    def test_search_many_exact_hits_on_collapsed_edges(self):
+        """Test exact lookups that end before, inside, or after long collapsed edges"""
+        tail = "x" * 40
+        entries = ["ab" + tail, "ab" + tail + "yz", "ac" + tail, "ab" + tail[:20]]
+        queries = entries + ["ab" + tail[:30], "ab" + tail + "y", "ab" + tail[:-1] + "q", "a"]
+        trie = PrefixTrie(entries, allow_indels=True)
+        found, corrections = trie._trie.search_many(queries, 0)
+        assert found == entries + [None, None, None, None]
+        assert corrections == [0, 0, 0, 0, -1, -1, -1, -1]
+
+    def test_zero_budget_misses_skip_fuzzy_search(self):
+        """Test that budget-0 misses report no match even when a one-edit neighbour exists"""
+        entries = ["ACGT", "ACGTT", "GGCC"]
+        for immutable in (True, False):
+            trie = PrefixTrie(entries, allow_indels=True, immutable=immutable)
+            queries = ["ACGA", "ACG", "ACGTTT", "", "GGCC"]
+            assert trie._trie.search_many(queries, 0) == ([None, None, None, None, "GGCC"], [-1, -1, -1, -1, 0])
+            assert [trie._trie.search(q, 0) for q in queries] == [(None, -1)] * 4 + [("GGCC", 0)]
+
+    def test_search_bytes_queries(self):
+        """Test that UTF-8 encoded bytes queries match the same entries as str queries"""
+        entries = ["ACGT", "ACGG", "héllo"]
+        trie = PrefixTrie(entries, allow_indels=True)
+        queries = ["ACGT", "ACGA", "ACG", "hello", "héllo", "TTTT"]
+        for budget in (0, 1, 2):
+            for query in queries:
+                assert trie.search(query.encode(), budget) == trie.search(query, budget)
+            expected = trie.search_many(queries, budget)
+            assert trie.search_many([q.encode() for q in queries], budget) == expected
+
+    def test_search_many_mixed_bytes_and_str_queries(self):
+        """Test that each query in a mixed bytes/str batch is matched regardless of its neighbours"""
+        trie = PrefixTrie(["abc", "abd"], allow_indels=True)
+        for queries in (["abc", b"abd"], [b"abc", "abd"]):
+            assert trie.search_many(queries) == (["abc", "abd"], [0, 0])
+        for budget in (0, 1):
+            for queries in (["abc", b"abd", b"zzz", "zzz"], [b"abc", "abd", "zzz", b"zzz"]):
+                expected = [trie.search(q, budget) for q in queries]
+                found, corrections = trie.search_many(queries, budget)
+                assert list(zip(found, corrections)) == expected
+        assert trie.search_many(["abx", b"abx"], 1) == (["abc", "abc"], [1, 1])
+
+    def test_search_rejects_non_string_queries(self):
+        """Test that queries which are neither str nor bytes raise TypeError"""
+        trie = PrefixTrie(["ACGT"], allow_indels=True)
+        with pytest.raises(TypeError):
+            trie.search(1234, 1)
+        with pytest.raises(TypeError):
+            trie.search_many(["ACGT", None], 1)
+
+
+class TestPrefixTrieSearchPacked:
+    """Test exact search over 2-bit packed DNA queries"""
+
+    @staticmethod
+    def _pack(queries):
+        """Pack DNA queries 2 bits per base, four bases per byte, first base in the high bits"""
+        np = pytest.importorskip("numpy")
+        row_bytes = (max(map(len, queries), default=0) + 3) // 4
+        packed = np.zeros((len(queries), row_bytes), dtype=np.uint8)
+        for i, query in enumerate(queries):
+            for j, base in enumerate(query):
+                packed[i, j // 4] |= "ACGT".index(base) << (6 - 2 * (j % 4))
+        return packed, np.array([len(q) for q in queries], dtype=np.intp)
+
+    def test_search_packed_matches_search(self):
+        """Test packed search agrees with exact search for hits and misses"""
+        entries = ["ACGT", "ACGTA", "ACGTACGTA", "TTTT", "GATTACA"]
+        queries = ["ACGT", "ACGTA", "ACG", "ACGTACGTA", "ACGTACGTT", "GATTACA", "CCCC", ""]
+        for immutable in (True, False):
+            trie = PrefixTrie(entries, immutable=immutable)
+            packed, lengths = self._pack(queries)
+            assert trie.search_packed(packed, lengths) == [trie.search(q)[0] for q in queries]
+
+    def test_search_packed_missing_bases(self):
+        """Test packed search on a trie whose alphabet lacks some bases"""
+        trie = PrefixTrie(["AAAA", "AC"])
+        packed, lengths = self._pack(["AAAA", "AC", "GT", "AAAT"])
+        assert trie.search_packed(packed, lengths) == ["AAAA", "AC", None, None]
+
+    def test_search_packed_empty(self):
+        """Test packed search with no queries and with the empty entry"""
+        np = pytest.importorskip("numpy")
+        trie = PrefixTrie(["", "ACGT"])
+        assert trie.search_packed(np.zeros((0, 1), dtype=np.uint8), np.zeros(0, dtype=np.intp)) == []
+        assert trie.search_packed(np.zeros((1, 1), dtype=np.uint8), np.zeros(1, dtype=np.intp)) == [""]
+
+    def test_search_packed_ignores_padding_bits(self):
+        """Test packed search ignores bits past the end of each query"""
+        np = pytest.importorskip("numpy")
+        trie = PrefixTrie(["A", "AC", "ACGTA"])
+        packed = np.array([[0b00111111, 0xFF], [0b00011111, 0x00], [0b00011011, 0b00111111]], dtype=np.uint8)
+        lengths = np.array([1, 2, 5], dtype=np.intp)
+        assert trie.search_packed(packed, lengths) == ["A", "AC", "ACGTA"]
+
+    def test_search_packed_non_dna_entries(self):
+        """Test packed search skips entries that cannot be packed"""
+        trie = PrefixTrie(["ACGT", "ACGN", "hello"])
+        packed, lengths = self._pack(["ACGT", "ACG"])
+        assert trie.search_packed(packed, lengths) == ["ACGT", None]
+
+    def test_search_packed_after_modification(self):
+        """Test packed search sees entries added to or removed from a mutable trie"""
+        trie = PrefixTrie(["ACGT"], immutable=False)
+        packed, lengths = self._pack(["ACGT", "GGCC"])
+        assert trie.search_packed(packed, lengths) == ["ACGT", None]
+        trie.add("GGCC")
+        assert trie.search_packed(packed, lengths) == ["ACGT", "GGCC"]
+        trie.remove("ACGT")
+        assert trie.search_packed(packed, lengths) == [None, "GGCC"]
+
+    def test_search_packed_invalid_lengths(self):
+        """Test packed search rejects lengths that do not fit the packed rows"""
+        np = pytest.importorskip("numpy")
+        trie = PrefixTrie(["ACGT"])
+        packed, lengths = self._pack(["ACGT"])
+        with pytest.raises(ValueError):
+            trie.search_packed(packed, np.array([5], dtype=np.intp))
+        with pytest.raises(ValueError):
+            trie.search_packed(packed, np.array([4, 4], dtype=np.intp))
+
+
+class TestPrefixTrieBitParallel:
+    """Test fuzzy search with Myers' bit-parallel edit distance"""
+
+    @staticmethod
+    def _edit_distance(a, b):
+        """Reference Levenshtein distance"""
+        prev = list(range(len(b) + 1))
+        for i, ca in enumerate(a, 1):
+            curr = [i]
+            for j, cb in enumerate(b, 1):
+                curr.append(min(prev[j] + 1, curr[j - 1] + 1, prev[j - 1] + (ca != cb)))
+            prev = curr
+        return prev[-1]
+
+    def test_finds_closest_entry(self):
+        """Test bit-parallel search returns an entry at the smallest edit distance"""
+        import random
+        rng = random.Random(0)
+        for _ in range(50):
+            entries = list({"".join(rng.choices("ACGT", k=rng.randint(1, 12))) for _ in range(30)})
+            trie = PrefixTrie(entries, allow_indels=True, use_bitparallel=True)
+            for _ in range(10):
+                query = "".join(rng.choices("ACGT", k=rng.randint(1, 14)))
+                budget = rng.randint(0, 3)
+                best = min(self._edit_distance(query, entry) for entry in entries)
+                result, corrections = trie.search(query, correction_budget=budget)
+                if best > budget:
+                    assert (result, corrections) == (None, -1)
+                else:
+                    assert corrections == best
+                    assert self._edit_distance(query, result) == best
+
+    def test_search_many_matches_search(self):
+        """Test batch and single bit-parallel searches agree"""
+        entries = ["algorithm", "logarithm", "rhythm", "rhyme", "alright"]
+        queries = ["algrothm", "rythem", "rhym", "alrigth", "logarithms", "xyz", "rhythm"]
+        trie = PrefixTrie(entries, allow_indels=True, use_bitparallel=True)
+        for budget in range(4):
+            found, corrections = trie._trie.search_many(queries, budget)
+            assert list(zip(found, corrections)) == [trie._trie.search(q, budget) for q in queries]
+
+    def test_long_queries_fall_back(self):
+        """Test queries longer than 64 characters still use the classical search"""
+        entries = ["A" * 70, "C" * 70]
+        trie = PrefixTrie(entries, allow_indels=True, use_bitparallel=True)
+        classical = PrefixTrie(entries, allow_indels=True)
+        query = "A" * 69 + "G"
+        assert trie.search(query, correction_budget=1) == classical.search(query, correction_budget=1)
+        assert trie.search(query, correction_budget=1) == ("A" * 70, 1)
+
+    def test_ignored_without_indels(self):
+        """Test the flag does not turn substitution-only tries into edit distance searches"""
+        trie = PrefixTrie(["ACGT"], use_bitparallel=True)
+        assert trie.search("ACG", correction_budget=1) == (None, -1)
+        assert trie.search("ACGA", correction_budget=1) == ("ACGT", 1)
+
+    def test_mutable_trie(self):
+        """Test bit-parallel search sees entries added to or removed from a mutable trie"""
+        trie = PrefixTrie(["apple"], allow_indels=True, immutable=False, use_bitparallel=True)
+        trie.add("apply")
+        trie.remove("apple")
+        assert trie.search("appl", correction_budget=1) == ("apply", 1)
@@ -173,6 +173,15 @@ class TestPrefixTriePickle:
         assert result == "rhythm"
         assert corrections > 0
 
+    def test_pickle_bitparallel_flag(self):
+        """Test that the bit-parallel search setting survives a pickle roundtrip"""
+        trie = PrefixTrie(["algorithm", "logarithm", "rhythm"], allow_indels=True, use_bitparallel=True)
+
+        restored_trie = pickle.loads(pickle.dumps(trie))
+
+        assert restored_trie.use_bitparallel
+        assert restored_trie.search("algrothm", correction_budget=2) == trie.search("algrothm", correction_budget=2)
+
     def test_pickle_different_protocols(self):
         """Test pickle with different protocol versions"""
         entries = ["cat", "car", "card", "care"]
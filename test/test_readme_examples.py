@@ -67,6 +67,23 @@ class TestReadmeBasicUsage:
 class TestReadmeAdvancedSearchOperations:
     """Test advanced search operations from README"""
 
+    def test_batch_search_examples(self):
+        """Test batch search examples from README"""
+        trie = PrefixTrie(["ACGT", "ACGG", "ACGC"], allow_indels=True)
+
+        results, corrections = trie.search_many(["ACGT", "ACGA", "TTTT"], correction_budget=1)
+        assert results == ["ACGT", "ACGT", None]
+        assert corrections == [0, 1, -1]
+
+    def test_packed_dna_search_examples(self):
+        """Test packed DNA search examples from README"""
+        np = pytest.importorskip("numpy")
+        trie = PrefixTrie(["ACGT", "GGCC"])
+
+        packed = np.array([[0b00011011], [0b11111111]], dtype=np.uint8)  # "ACGT", "TTTT"
+        lengths = np.array([4, 4], dtype=np.intp)
+        assert trie.search_packed(packed, lengths) == ["ACGT", None]
+
     def test_substring_search_examples(self):
         """Test substring search examples from README"""
         trie = PrefixTrie(["HELLO", "WORLD"], allow_indels=True)